@@ -11,6 +11,7 @@ python cli.py scrape pokeapi --start 1 --end 151  # Gen 1 only
 python cli.py scrape pokemondb                  # all games
 python cli.py scrape pokemondb --game platinum  # one game
 python cli.py scrape all                        # run both scrapers
+python cli.py scrape pokemondb --refresh        # re-scrape existing output (HTTP cache revalidated)
 
 # Pipeline
 python cli.py pipeline build-docs               # Phase 2: JSON → text documents
@@ -30,7 +31,9 @@ from __future__ import annotations
 
 import argparse
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 
 
@@ -62,18 +65,20 @@ def cmd_scrape_pokeapi(args: argparse.Namespace) -> None:
         cache_dir=Path(args.cache_dir),
         output_dir=Path(args.output_dir),
         calls_per_second=args.rps,
+        refresh=args.refresh,
     )
     scraper = PokeAPIScraper(config=config)
     dex_range = range(args.start, args.end + 1)
 
-    if args.only:
+    only = getattr(args, "only", None)  # `scrape all` has no --only flag
+    if only:
         dispatch = {
             "pokemon": lambda: scraper.scrape_all_pokemon(dex_range=dex_range),
             "moves": scraper.scrape_all_moves,
             "abilities": scraper.scrape_all_abilities,
             "types": scraper.scrape_all_types,
         }
-        dispatch[args.only]()
+        dispatch[only]()
     else:
         scraper.scrape_all(dex_range=dex_range)
 
@@ -86,19 +91,60 @@ def cmd_scrape_pokemondb(args: argparse.Namespace) -> None:
         cache_dir=Path(args.cache_dir),
         output_dir=Path(args.output_dir),
         calls_per_second=args.rps,
+        refresh=args.refresh,
     )
     scraper = PokemonDBScraper(config=config)
 
-    if args.game and args.game != "all":
-        scraper.scrape_version_group(args.game)
+    game = getattr(args, "game", None)  # `scrape all` has no --game flag
+    if game and game != "all":
+        scraper.scrape_version_group(game)
     else:
         scraper.scrape_all()
 
 
 def cmd_scrape_all(args: argparse.Namespace) -> None:
-    """Run both scrapers sequentially."""
-    cmd_scrape_pokeapi(args)
-    cmd_scrape_pokemondb(args)
+    """
+    Run both scrapers concurrently.
+
+    PokeAPI and PokemonDB are different hosts and each scraper has its own
+    session and rate limiter, so overlapping them takes roughly as long as
+    the slower scrape instead of the sum of both.  PokemonDB runs at its own
+    ``--pokemondb-rps`` so the HTML site keeps its gentler default rate.
+
+    The scrapers run on daemon threads so Ctrl-C or the first failure ends
+    the command immediately instead of waiting for the other scrape.  All
+    scraper writes are atomic, so the scrape that gets cut off never leaves
+    a truncated JSON file behind.
+    """
+    pokemondb_args = argparse.Namespace(**{**vars(args), "rps": args.pokemondb_rps})
+    handlers = {
+        "pokeapi": lambda: cmd_scrape_pokeapi(args),
+        "pokemondb": lambda: cmd_scrape_pokemondb(pokemondb_args),
+    }
+    done: queue.Queue[tuple[str, BaseException | None]] = queue.Queue()
+
+    def run(name: str) -> None:
+        try:
+            handlers[name]()
+        except BaseException as exc:  # re-raised in the main thread below
+            done.put((name, exc))
+        else:
+            done.put((name, None))
+
+    for name in handlers:
+        threading.Thread(target=run, args=(name,), name=f"scrape-{name}", daemon=True).start()
+
+    pending = len(handlers)
+    while pending:
+        try:
+            # Short timeout keeps the main thread responsive to Ctrl-C
+            name, exc = done.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        pending -= 1
+        if exc is not None:
+            logging.getLogger(__name__).error(f"{name} scraper failed — aborting 'scrape all'")
+            raise exc
 
 
 def cmd_build_docs(args: argparse.Namespace) -> None:
@@ -221,6 +267,7 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Scrape only one category",
     )
+    pa.add_argument("--refresh", action="store_true", help="Re-scrape existing output, revalidating cached responses")
     pa.set_defaults(func=cmd_scrape_pokeapi)
 
     # -- scrape pokemondb --
@@ -231,13 +278,16 @@ def build_parser() -> argparse.ArgumentParser:
         help="Version-group slug or 'all'  (e.g. platinum)",
     )
     pb.add_argument("--rps", type=float, default=0.8)
+    pb.add_argument("--refresh", action="store_true", help="Re-scrape existing output, revalidating cached responses")
     pb.set_defaults(func=cmd_scrape_pokemondb)
 
     # -- scrape all --
     pa2 = scrape_sub.add_parser("all", help="Run all scrapers")
     pa2.add_argument("--start", type=int, default=1)
     pa2.add_argument("--end", type=int, default=493)
-    pa2.add_argument("--rps", type=float, default=1.5)
+    pa2.add_argument("--rps", type=float, default=1.5, help="PokeAPI requests per second")
+    pa2.add_argument("--pokemondb-rps", type=float, default=0.8, help="PokemonDB requests per second")
+    pa2.add_argument("--refresh", action="store_true", help="Re-scrape existing output, revalidating cached responses")
     pa2.set_defaults(func=cmd_scrape_all)
 
     # ================================================================
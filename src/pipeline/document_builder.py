@@ -121,6 +121,11 @@ TYPE_WEAKNESSES: dict[str, str] = {
     "fairy":    "Poison, Steel",
 }
 
+# Noise suffixes stripped from PokeAPI location-area slugs (see _location_name).
+# Compiled once — _location_name runs for every encounter of every Pokemon.
+_AREA_SUFFIX_RE = re.compile(r"-area$")
+_FLOOR_SUFFIX_RE = re.compile(r"-(1f|2f|3f|b1f|b2f|b3f)$")
+
 
 # ---------------------------------------------------------------------------
 # Document dataclass
@@ -215,6 +220,11 @@ class DocumentBuilder:
         # Lazy-loaded caches so each JSON file is read at most once
         self._move_cache: dict[str, Optional[dict]] = {}
         self._ability_cache: dict[str, Optional[dict]] = {}
+        # Parsed raw Pokemon files, shared by the overview and per-game builders
+        self._pokemon_cache: Optional[list[tuple[Path, dict]]] = None
+        # Formatted _move_line() output — the same move appears in hundreds of
+        # pokemon_game documents, so format it once per build
+        self._move_line_cache: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Private text-formatting helpers
@@ -235,8 +245,8 @@ class DocumentBuilder:
         'route-1-area'      → 'Route 1'
         """
         # Remove noise suffixes
-        slug = re.sub(r"-area$", "", slug)
-        slug = re.sub(r"-(1f|2f|3f|b1f|b2f|b3f)$", r" \1", slug)
+        slug = _AREA_SUFFIX_RE.sub("", slug)
+        slug = _FLOOR_SUFFIX_RE.sub(r" \1", slug)
         return slug.replace("-", " ").title()
 
     @staticmethod
@@ -266,6 +276,24 @@ class DocumentBuilder:
                 self._move_cache[move_name] = None
         return self._move_cache[move_name]
 
+    def _load_pokemon(self) -> list[tuple[Path, dict]]:
+        """
+        Load every raw Pokemon JSON file once and cache ``(path, data)`` pairs.
+
+        build_pokemon_overview_docs and build_pokemon_game_docs both walk the
+        same ~500 files; sharing one parsed copy halves the disk reads and
+        JSON parsing of a full build.
+        """
+        if self._pokemon_cache is None:
+            records: list[tuple[Path, dict]] = []
+            for json_file in sorted((self.raw_dir / "pokemon").glob("*.json")):
+                try:
+                    records.append((json_file, json.loads(json_file.read_text(encoding="utf-8"))))
+                except (json.JSONDecodeError, OSError) as exc:
+                    logger.warning(f"Could not read {json_file}: {exc}")
+            self._pokemon_cache = records
+        return self._pokemon_cache
+
     def _move_line(self, move_name: str) -> str:
         """
         Format a move as a one-line summary including type, class, power, accuracy.
@@ -273,22 +301,28 @@ class DocumentBuilder:
         'flamethrower' → 'Flamethrower (Fire, Special, Pow: 90, Acc: 100%)'
         'growl'        → 'Growl (Normal, Status, Acc: 100%)'
         """
+        cached = self._move_line_cache.get(move_name)
+        if cached is not None:
+            return cached
+
         data = self._load_move(move_name)
-        display = move_name.replace("-", " ").title()
-        if not data:
-            return display
+        line = move_name.replace("-", " ").title()
 
         parts: list[str] = []
-        if data.get("type"):
-            parts.append(data["type"].title())
-        if data.get("damage_class"):
-            parts.append(data["damage_class"].title())
-        if data.get("power"):
-            parts.append(f"Pow: {data['power']}")
-        if data.get("accuracy"):
-            parts.append(f"Acc: {data['accuracy']}%")
+        if data:
+            if data.get("type"):
+                parts.append(data["type"].title())
+            if data.get("damage_class"):
+                parts.append(data["damage_class"].title())
+            if data.get("power"):
+                parts.append(f"Pow: {data['power']}")
+            if data.get("accuracy"):
+                parts.append(f"Acc: {data['accuracy']}%")
+        if parts:
+            line = f"{line} ({', '.join(parts)})"
 
-        return f"{display} ({', '.join(parts)})" if parts else display
+        self._move_line_cache[move_name] = line
+        return line
 
     @staticmethod
     def _evo_chain_text(chain: list[dict]) -> str:
@@ -369,13 +403,7 @@ class DocumentBuilder:
             logger.warning(f"Pokemon directory not found: {pokemon_dir}. Run pokeapi.py first.")
             return docs
 
-        for json_file in sorted(pokemon_dir.glob("*.json")):
-            try:
-                p: dict = json.loads(json_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning(f"Could not read {json_file}: {exc}")
-                continue
-
+        for json_file, p in self._load_pokemon():
             dex_num: int = p.get("national_dex", 0)
             name: str = p.get("name", "unknown").replace("-", " ").title()
             types: str = " / ".join(t.title() for t in p.get("types", []))
@@ -470,12 +498,7 @@ class DocumentBuilder:
         if not pokemon_dir.exists():
             return docs
 
-        for json_file in sorted(pokemon_dir.glob("*.json")):
-            try:
-                p: dict = json.loads(json_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                continue
-
+        for json_file, p in self._load_pokemon():
             dex_num: int = p.get("national_dex", 0)
             name: str = p.get("name", "unknown").replace("-", " ").title()
             moves_by_vg: dict = p.get("moves", {})
@@ -1058,11 +1081,12 @@ class DocumentBuilder:
             docs = builder_fn()
             all_docs.extend(docs)
 
-            # Save as JSONL
+            # Save as JSONL — one buffered writelines() call per file
             out_file = self.output_dir / f"{stem}.jsonl"
-            with open(out_file, "w", encoding="utf-8") as fh:
-                for doc in docs:
-                    fh.write(json.dumps(doc.to_dict(), ensure_ascii=False) + "\n")
+            with open(out_file, "w", encoding="utf-8", buffering=1 << 20) as fh:
+                fh.writelines(
+                    json.dumps(doc.to_dict(), ensure_ascii=False) + "\n" for doc in docs
+                )
 
             logger.info(f"  ✓ {stem:20s} {len(docs):>6,} docs  →  {out_file}")
 
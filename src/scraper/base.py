@@ -5,7 +5,8 @@ Every scraper (PokeAPI, PokemonDB …) inherits from BaseScraper and gets
 the following for free:
 
   - A requests.Session pre-configured with exponential-backoff retries
-  - Transparent disk caching for both JSON responses and raw HTML pages
+  - Transparent disk caching for both JSON responses and raw HTML pages,
+    with ETag / Last-Modified revalidation when a refresh is forced
   - A fixed-interval rate limiter so we stay polite to upstream servers
   - save_json / load_json convenience helpers
   - An abstract scrape_all() contract that subclasses must implement
@@ -22,6 +23,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -56,6 +58,10 @@ class ScrapeConfig:
         How many times to retry a failed request (with exponential back-off).
     timeout : int
         Per-request timeout in seconds.
+    refresh : bool
+        Re-scrape everything, even items whose output JSON already exists.
+        Cached HTTP responses are revalidated with ETag / Last-Modified, so
+        unchanged resources cost a bodiless ``304`` instead of a download.
     """
 
     cache_dir: Path = field(default_factory=lambda: Path("data/raw/scraper_cache"))
@@ -63,6 +69,7 @@ class ScrapeConfig:
     calls_per_second: float = 1.5
     max_retries: int = 3
     timeout: int = 30
+    refresh: bool = False
 
     def __post_init__(self) -> None:
         # Accept plain strings so callers can write ScrapeConfig(cache_dir="…")
@@ -98,6 +105,24 @@ class RateLimiter:
         self._last_call = time.monotonic()
 
 
+# ---------------------------------------------------------------------------
+# Atomic file writes
+# ---------------------------------------------------------------------------
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """
+    Write *text* to *path* via a temp file + ``os.replace``.
+
+    A scraper killed mid-write (Ctrl-C, or ``scrape all`` aborting after
+    the other scraper failed) leaves either the old file or the new one,
+    never a truncated file that the "already on disk" checks would trust.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 # ---------------------------------------------------------------------------
 # Abstract base scraper
 # ---------------------------------------------------------------------------
@@ -175,6 +200,49 @@ class BaseScraper(ABC):
             safe = safe[:160] + "__" + hashlib.md5(safe.encode()).hexdigest()[:8]
         return self.config.cache_dir / f"{safe}{suffix}"
 
+    # ------------------------------------------------------------------
+    # Conditional-request helpers (ETag / Last-Modified)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _validators_path(cache_file: Path) -> Path:
+        """Sidecar file holding the HTTP validators for *cache_file*."""
+        return cache_file.with_name(cache_file.name + ".validators")
+
+    def _conditional_headers(self, cache_file: Path) -> dict[str, str]:
+        """
+        Build ``If-None-Match`` / ``If-Modified-Since`` headers for a cached URL.
+
+        Only call this once the cached body is known to load — a ``304`` is
+        answered from it.  Returns an empty dict when the upstream server did
+        not send any validators last time.
+        """
+        try:
+            validators = json.loads(
+                self._validators_path(cache_file).read_text(encoding="utf-8")
+            )
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+        headers: dict[str, str] = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _save_validators(self, cache_file: Path, resp: requests.Response) -> None:
+        """Persist the ``ETag`` / ``Last-Modified`` headers of *resp* next to the cache."""
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        path = self._validators_path(cache_file)
+        if any(validators.values()):
+            _write_text_atomic(path, json.dumps(validators))
+        else:
+            path.unlink(missing_ok=True)
+
     # ------------------------------------------------------------------
     # HTTP helpers
     # ------------------------------------------------------------------
@@ -192,20 +260,33 @@ class BaseScraper(ABC):
         url : str
             Full URL to fetch.
         use_cache : bool
-            Set to ``False`` to force a fresh HTTP request.
+            Set to ``False`` (or set ``ScrapeConfig.refresh``) to force a fresh
+            HTTP request.  If a readable cached copy exists the request is made
+            conditional (ETag / Last-Modified), so an unchanged resource costs
+            a bodiless ``304`` instead of a download.
         """
         cache_file = self._cache_path(url, suffix=".json")
+        use_cache = use_cache and not self.config.refresh
 
-        if use_cache and cache_file.exists():
+        cached: Any = None
+        headers: dict[str, str] = {}
+        if cache_file.exists():
             try:
                 with open(cache_file, encoding="utf-8") as fh:
-                    return json.load(fh)
+                    cached = json.load(fh)
             except (json.JSONDecodeError, OSError):
                 self.logger.warning(f"Corrupt JSON cache at {cache_file} — re-fetching.")
+            else:
+                if use_cache:
+                    return cached
+                headers = self._conditional_headers(cache_file)
 
         self._rate_limiter.wait()
         try:
-            resp = self._session.get(url, timeout=self.config.timeout)
+            resp = self._session.get(url, timeout=self.config.timeout, headers=headers)
+            if resp.status_code == 304 and headers:
+                self.logger.debug(f"304 Not Modified: {url}")
+                return cached
             resp.raise_for_status()
             data = resp.json()
         except requests.HTTPError as exc:
@@ -220,8 +301,8 @@ class BaseScraper(ABC):
             return None
 
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False)
+        _write_text_atomic(cache_file, json.dumps(data, ensure_ascii=False))
+        self._save_validators(cache_file, resp)
 
         return data
 
@@ -230,19 +311,30 @@ class BaseScraper(ABC):
         Fetch *url* and return the raw HTML as a string.
 
         Cached separately from JSON responses (uses ``.html`` extension).
-        Returns ``None`` on 404 or unrecoverable errors.
+        ``use_cache=False`` revalidates the cached page the same way as
+        :py:meth:`get_json`.  Returns ``None`` on 404 or unrecoverable errors.
         """
         cache_file = self._cache_path(url, suffix=".html")
+        use_cache = use_cache and not self.config.refresh
 
-        if use_cache and cache_file.exists():
+        cached: Optional[str] = None
+        headers: dict[str, str] = {}
+        if cache_file.exists():
             try:
-                return cache_file.read_text(encoding="utf-8")
-            except OSError:
+                cached = cache_file.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
                 self.logger.warning(f"Unreadable HTML cache at {cache_file} — re-fetching.")
+            else:
+                if use_cache:
+                    return cached
+                headers = self._conditional_headers(cache_file)
 
         self._rate_limiter.wait()
         try:
-            resp = self._session.get(url, timeout=self.config.timeout)
+            resp = self._session.get(url, timeout=self.config.timeout, headers=headers)
+            if resp.status_code == 304 and headers:
+                self.logger.debug(f"304 Not Modified: {url}")
+                return cached
             resp.raise_for_status()
             html = resp.text
         except requests.HTTPError as exc:
@@ -257,7 +349,8 @@ class BaseScraper(ABC):
             return None
 
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(html, encoding="utf-8")
+        _write_text_atomic(cache_file, html)
+        self._save_validators(cache_file, resp)
         return html
 
     # ------------------------------------------------------------------
@@ -265,10 +358,9 @@ class BaseScraper(ABC):
     # ------------------------------------------------------------------
 
     def save_json(self, data: Any, path: Path) -> None:
-        """Write *data* as indented JSON to *path* (creates parent dirs)."""
+        """Atomically write *data* as indented JSON to *path* (creates parent dirs)."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        _write_text_atomic(path, json.dumps(data, indent=2, ensure_ascii=False))
         self.logger.debug(f"Saved → {path}")
 
     def load_json(self, path: Path) -> Optional[Any]:
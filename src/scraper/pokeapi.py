@@ -536,7 +536,7 @@ class PokeAPIScraper(BaseScraper):
         for dex_num in dex_range:
             out_file = out_dir / f"{dex_num:04d}.json"
 
-            if out_file.exists():
+            if out_file.exists() and not self.config.refresh:
                 self.logger.debug(f"#{dex_num:03d} already on disk — loading.")
                 cached = self.load_json(out_file)
                 if cached:
@@ -584,7 +584,7 @@ class PokeAPIScraper(BaseScraper):
         all_moves: dict[str, dict] = {}
         for move_name in sorted(move_names):
             out_file = out_dir / f"{move_name}.json"
-            if out_file.exists():
+            if out_file.exists() and not self.config.refresh:
                 cached = self.load_json(out_file)
                 if cached:
                     all_moves[move_name] = cached
@@ -621,7 +621,7 @@ class PokeAPIScraper(BaseScraper):
         all_abilities: dict[str, dict] = {}
         for ability_name in sorted(ability_names):
             out_file = out_dir / f"{ability_name}.json"
-            if out_file.exists():
+            if out_file.exists() and not self.config.refresh:
                 cached = self.load_json(out_file)
                 if cached:
                     all_abilities[ability_name] = cached
@@ -657,7 +657,7 @@ class PokeAPIScraper(BaseScraper):
         all_types: dict[str, dict] = {}
         for type_name in type_names:
             out_file = out_dir / f"{type_name}.json"
-            if out_file.exists():
+            if out_file.exists() and not self.config.refresh:
                 cached = self.load_json(out_file)
                 if cached:
                     all_types[type_name] = cached
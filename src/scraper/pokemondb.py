@@ -33,11 +33,12 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from src.scraper.base import BaseScraper, ScrapeConfig
 
@@ -73,6 +74,12 @@ VERSION_GROUP_TO_REGION: dict[str, str] = {
     "platinum": "sinnoh",
 }
 
+# Reverse of VERSION_GROUP_TO_REGION, built once.  Where a region has several
+# version groups the last one listed wins (johto → heartgold-soulsilver).
+REGION_TO_VERSION_GROUP: dict[str, str] = {
+    region: vg for vg, region in VERSION_GROUP_TO_REGION.items()
+}
+
 # All version-group slugs we care about (de-duplicated)
 ALL_VERSION_GROUPS: list[str] = list(dict.fromkeys(GAME_DEX_SLUGS.values()))
 
@@ -86,6 +93,13 @@ GAME_DISPLAY_NAMES: dict[str, str] = {
     "platinum": "Platinum",
 }
 
+# ---------------------------------------------------------------------------
+# Item scraping constants
+# ---------------------------------------------------------------------------
+
+# Strips everything but digits from a shop price cell ("₽2,100" → "2100")
+_NON_DIGIT_RE = re.compile(r"\D")
+
 # ---------------------------------------------------------------------------
 # Data dataclasses
 # ---------------------------------------------------------------------------
@@ -158,7 +172,8 @@ class ItemLocation:
 def _to_dict(obj: Any) -> Any:
     """Recursively convert dataclasses and lists to JSON-serialisable dicts."""
     if hasattr(obj, "__dataclass_fields__"):
-        return {k: _to_dict(v) for k, v in asdict(obj).items()}
+        # asdict() already recurses into nested dataclasses and lists
+        return asdict(obj)
     if isinstance(obj, list):
         return [_to_dict(i) for i in obj]
     return obj
@@ -206,15 +221,29 @@ class PokemonDBScraper(BaseScraper):
     def _pokemon_url(self, name: str) -> str:
         return f"{POKEMONDB_BASE}/pokedex/{name.lower().replace(' ', '-')}"
 
+    def _item_url(self, item_slug: str) -> str:
+        return f"{POKEMONDB_BASE}/item/{item_slug}"
+
     # ------------------------------------------------------------------
     # HTML → BeautifulSoup
     # ------------------------------------------------------------------
 
-    def _soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _soup(
+        self,
+        url: str,
+        parse_only: Optional[SoupStrainer] = None,
+    ) -> Optional[BeautifulSoup]:
+        """
+        Fetch *url* and parse it.
+
+        Pass *parse_only* when the caller needs a narrow slice of the page
+        (e.g. just the ``<table>`` elements) — everything else is skipped at
+        parse time instead of being built into the tree.
+        """
         html = self.get_html(url)
         if html is None:
             return None
-        return BeautifulSoup(html, "lxml")
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
 
     # ------------------------------------------------------------------
     # Game Pokedex (which Pokemon are obtainable)
@@ -234,7 +263,7 @@ class PokemonDBScraper(BaseScraper):
         """
         url = self._game_dex_url(version_group_slug)
         self.logger.info(f"Scraping game dex: {url}")
-        soup = self._soup(url)
+        soup = self._soup(url, parse_only=SoupStrainer("table"))
         if soup is None:
             self.logger.warning(f"Could not fetch game dex for {version_group_slug}")
             return []
@@ -600,10 +629,12 @@ class PokemonDBScraper(BaseScraper):
 
         locations: list[ItemLocation] = []
         target_versions = self._version_group_to_versions(version_group_slug)
+        # Game cells read e.g. "fire red", so normalise the slugs once up front
+        target_labels = tuple(v.replace("-", " ") for v in target_versions)
 
         for item_slug in KEY_ITEMS:
-            url = f"{POKEMONDB_BASE}/item/{item_slug}"
-            soup = self._soup(url)
+            url = self._item_url(item_slug)
+            soup = self._soup(url, parse_only=SoupStrainer("table"))
             if soup is None:
                 continue
 
@@ -618,7 +649,7 @@ class PokemonDBScraper(BaseScraper):
                         continue
                     game_text = cells[0].get_text(strip=True).lower()
                     # Check if this row is for one of our target versions
-                    if not any(v.replace("-", " ") in game_text for v in target_versions):
+                    if not any(label in game_text for label in target_labels):
                         continue
 
                     location_text = cells[1].get_text(strip=True) if len(cells) > 1 else ""
@@ -638,8 +669,7 @@ class PokemonDBScraper(BaseScraper):
                     price: Optional[int] = None
                     price_tag = row.find(string=lambda t: t and "₽" in (t or "") or "P" in (t or ""))
                     if price_tag:
-                        import re
-                        digits = re.sub(r"\D", "", price_tag)
+                        digits = _NON_DIGIT_RE.sub("", price_tag)
                         if digits:
                             price = int(digits)
 
@@ -664,8 +694,7 @@ class PokemonDBScraper(BaseScraper):
 
     @staticmethod
     def _region_to_version_group(region: str) -> str:
-        reverse = {v: k for k, v in VERSION_GROUP_TO_REGION.items()}
-        return reverse.get(region, region)
+        return REGION_TO_VERSION_GROUP.get(region, region)
 
     @staticmethod
     def _version_group_to_versions(vg: str) -> list[str]:
@@ -684,10 +713,12 @@ class PokemonDBScraper(BaseScraper):
         version_group_slug: str,
         filename: str,
         data: list[Any],
-    ) -> None:
+    ) -> list[Any]:
+        """Serialise *data* once, save it, and return the serialised list."""
         out_path = self._game_out_dir(version_group_slug) / filename
         serialisable = [_to_dict(item) for item in data]
         self.save_json(serialisable, out_path)
+        return serialisable
 
     # ------------------------------------------------------------------
     # Full pipeline
@@ -707,17 +738,16 @@ class PokemonDBScraper(BaseScraper):
 
         # ---- 1. Obtainable Pokemon ----
         dex_path = self._game_out_dir(version_group_slug) / "pokedex.json"
-        if dex_path.exists():
+        if dex_path.exists() and not self.config.refresh:
             self.logger.info("  pokedex.json already exists — skipping.")
             pokedex = self.load_json(dex_path) or []
         else:
             pokedex_entries = self.scrape_game_pokedex(version_group_slug)
-            self._save_game_data(version_group_slug, "pokedex.json", pokedex_entries)
-            pokedex = [_to_dict(e) for e in pokedex_entries]
+            pokedex = self._save_game_data(version_group_slug, "pokedex.json", pokedex_entries)
 
         # ---- 2. Gym leaders ----
         gyms_path = self._game_out_dir(version_group_slug) / "gym_leaders.json"
-        if gyms_path.exists():
+        if gyms_path.exists() and not self.config.refresh:
             self.logger.info("  gym_leaders.json already exists — skipping.")
             gym_leaders = self.load_json(gyms_path) or []
         else:
@@ -726,12 +756,13 @@ class PokemonDBScraper(BaseScraper):
             else:
                 self.logger.warning(f"No region mapping for {version_group_slug} — skipping gyms.")
                 gym_leader_entries = []
-            self._save_game_data(version_group_slug, "gym_leaders.json", gym_leader_entries)
-            gym_leaders = [_to_dict(e) for e in gym_leader_entries]
+            gym_leaders = self._save_game_data(
+                version_group_slug, "gym_leaders.json", gym_leader_entries
+            )
 
         # ---- 3. Elite Four ----
         e4_path = self._game_out_dir(version_group_slug) / "elite4.json"
-        if e4_path.exists():
+        if e4_path.exists() and not self.config.refresh:
             self.logger.info("  elite4.json already exists — skipping.")
             elite4 = self.load_json(e4_path) or []
         else:
@@ -740,18 +771,16 @@ class PokemonDBScraper(BaseScraper):
             else:
                 self.logger.warning(f"No region mapping for {version_group_slug} — skipping Elite Four.")
                 elite4_entries = []
-            self._save_game_data(version_group_slug, "elite4.json", elite4_entries)
-            elite4 = [_to_dict(e) for e in elite4_entries]
+            elite4 = self._save_game_data(version_group_slug, "elite4.json", elite4_entries)
 
         # ---- 4. Items ----
         items_path = self._game_out_dir(version_group_slug) / "items.json"
-        if items_path.exists():
+        if items_path.exists() and not self.config.refresh:
             self.logger.info("  items.json already exists — skipping.")
             items = self.load_json(items_path) or []
         else:
             item_entries = self.scrape_items(version_group_slug)
-            self._save_game_data(version_group_slug, "items.json", item_entries)
-            items = [_to_dict(e) for e in item_entries]
+            items = self._save_game_data(version_group_slug, "items.json", item_entries)
 
         # ---- Game metadata (counts, etc.) ----
         meta_path = self._game_out_dir(version_group_slug) / "metadata.json"